@@ -1,4 +1,5 @@
 import logging
+import sys
 
 from pyam.core import *
 from pyam.utils import *
@@ -15,30 +16,46 @@ from pyam.logging import defer_logging_config
 
 logger = logging.getLogger(__name__)
 
-# in Jupyter notebooks: disable autoscroll and set-up logging
-try:
-    from ipykernel.zmqshell import ZMQInteractiveShell
-    from IPython import get_ipython
-
-    shell = get_ipython()
-    if isinstance(shell, ZMQInteractiveShell):
-        shell.run_cell_magic(
-            u"javascript",
-            u"",
-            u"IPython.OutputArea.prototype._should_scroll = "
-            u"function(lines) { return false; }",
-        )
-        log_msg = "Running in a notebook, setting up a basic logging at level INFO"
-
-        defer_logging_config(
-            logger,
-            log_msg,
-            level="INFO",
-            format="%(name)s - %(levelname)s: %(message)s",
-        )
-
-except Exception:
-    pass
+
+def disable_notebook_autoscroll():
+    """Disable the autoscroll of cell outputs in a Jupyter notebook"""
+    try:
+        from IPython import get_ipython
+
+        shell = get_ipython()
+    except ImportError:
+        shell = None
+
+    if shell is None:
+        logger.warning("Not running in a notebook, cannot disable autoscroll")
+        return
+
+    shell.run_cell_magic(
+        "javascript",
+        "",
+        "IPython.OutputArea.prototype._should_scroll = "
+        "function(lines) { return false; }",
+    )
+
+
+# in Jupyter notebooks: set-up logging (only check if running in a kernel)
+if "ipykernel" in sys.modules:
+    try:
+        from ipykernel.zmqshell import ZMQInteractiveShell
+        from IPython import get_ipython
+
+        if isinstance(get_ipython(), ZMQInteractiveShell):
+            log_msg = "Running in a notebook, setting up a basic logging at level INFO"
+
+            defer_logging_config(
+                logger,
+                log_msg,
+                level="INFO",
+                format="%(name)s - %(levelname)s: %(message)s",
+            )
+
+    except ImportError:
+        pass
 
 from ._version import get_versions
 
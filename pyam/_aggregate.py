@@ -146,13 +146,14 @@ def _aggregate_time(df, variable, column, value, components, method=np.sum):
     # compute aggregate over time
     filter_args = dict(variable=variable)
     filter_args[column] = components
-    index = _list_diff(df.data.columns, [column, "value"])
+    index = _list_diff(df._LONG_IDX, [column])
 
+    # rows are unique by index, so unstacking is equivalent to a pivot table
     _data = pd.concat(
         [
             df.filter(**filter_args)
-            .data.pivot_table(index=index, columns=column)
-            .value.rename_axis(None, axis=1)
+            ._data.unstack(level=column)
+            .rename_axis(None, axis=1)
             .apply(_get_method_func(method), axis=1)
         ],
         names=[column] + index,
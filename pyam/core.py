@@ -1,6 +1,5 @@
 import copy
 import importlib
-import itertools
 import logging
 import os
 import sys
@@ -65,7 +64,7 @@ from pyam._aggregate import (
     _group_and_agg,
 )
 from pyam.units import convert_unit
-from pyam.index import get_index_levels
+from pyam.index import get_index_levels, get_index_levels_codes
 from pyam.logging import deprecation_warning
 
 logger = logging.getLogger(__name__)
@@ -114,6 +113,12 @@ class IamDataFrame(object):
     Calling the class with :code:`meta_sheet_name=False` will
     skip the import of the 'meta' table.
 
+    When initializing an :class:`IamDataFrame` from a parquet file,
+    kwargs are passed to :func:`pandas.read_parquet`, so only the relevant
+    :code:`columns` can be read and rows can be downselected with
+    :code:`filters` (e.g., :code:`filters=[('Region', 'in', ['World'])]`)
+    by the parquet engine before creating the object.
+
     When initializing an :class:`IamDataFrame` from an object that is already
     an :class:`IamDataFrame` instance, the new object will be hard-linked to
     all attributes of the original object - so any changes on one object
@@ -447,16 +452,14 @@ class IamDataFrame(object):
             deprecation_warning("Use the attribute `variable` instead.")
             return pd.Series(get_index_levels(self._data, _var), name=_var)
 
-        # else construct dataframe from variable and unit levels
+        # else construct dataframe from unique combinations of variable and unit
+        _cols = ["variable", "unit"]
         return (
-            pd.DataFrame(
-                zip(
-                    self._data.index.get_level_values("variable"),
-                    self._data.index.get_level_values("unit"),
-                ),
-                columns=["variable", "unit"],
+            self._data.index.droplevel(
+                [i for i in self._data.index.names if i not in _cols]
             )
-            .drop_duplicates()
+            .unique()
+            .to_frame(index=False)
             .sort_values("variable")
             .reset_index(drop=True)
         )
@@ -497,11 +500,7 @@ class IamDataFrame(object):
             other = IamDataFrame(other, **kwargs)
             ignore_meta_conflict = True
 
-        if self.time_col != other.time_col:
-            raise ValueError("Incompatible time format (`year` vs. `time`)")
-
-        if self._data.index.names != other._data.index.names:
-            raise ValueError("Incompatible timeseries data index dimensions")
+        _check_append_compatible(self, other)
 
         ret = self.copy() if not inplace else self
 
@@ -844,7 +843,7 @@ class IamDataFrame(object):
 
         # update meta dataframe
         self._new_meta_column(name)
-        self.meta.loc[idx, name] = value
+        self.meta.loc[self.meta.index.isin(idx), name] = value
         msg = "{} scenario{} categorized as `{}: {}`"
         logger.info(msg.format(len(idx), "" if len(idx) == 1 else "s", name, value))
 
@@ -1555,7 +1554,7 @@ class IamDataFrame(object):
     def _exclude_on_fail(self, df):
         """Assign a selection of scenarios as `exclude: True` in meta"""
         idx = df if isinstance(df, pd.MultiIndex) else _make_index(df)
-        self.meta.loc[idx, "exclude"] = True
+        self.meta.loc[self.meta.index.isin(idx), "exclude"] = True
         logger.info(
             "{} non-valid scenario{} will be excluded".format(
                 len(idx), "" if len(idx) == 1 else "s"
@@ -1590,15 +1589,18 @@ class IamDataFrame(object):
 
         _keep = self._apply_filters(**kwargs)
         _keep = _keep if keep else ~_keep
-        ret = self.copy() if not inplace else self
-        # TODO remove cast to list after refactoring `_apply_filters()`
-        ret._data = ret._data[list(_keep)]
-        ret._data.index = ret._data.index.remove_unused_levels()
+        _data = self._data[_keep]
+        _data.index = _data.index.remove_unused_levels()
+
+        # use the filtered data instead of a (deep)copy of the full data
+        ret = copy.deepcopy(self, {id(self._data): _data}) if not inplace else self
+        ret._data = _data
 
         idx = _make_index(ret._data)
         if len(idx) == 0:
             logger.warning("Filtered IamDataFrame is empty!")
         ret.meta = ret.meta.loc[idx]
+        ret.meta.index = ret.meta.index.remove_unused_levels()
         ret._set_attributes()
         if not inplace:
             return ret
@@ -1614,10 +1616,13 @@ class IamDataFrame(object):
             but accepts `regexp: True` in the dictionary to use regexp directly
         """
         regexp = filters.pop("regexp", False)
-        keep = np.array([True] * len(self))
+        keep = np.ones(len(self), dtype=bool)
 
-        # filter by columns and list of values
-        for col, values in filters.items():
+        # filter by columns and list of values, where filters by meta columns
+        # (requiring a lookup per row) are applied last on the remaining rows
+        for col, values in sorted(
+            filters.items(), key=lambda x: x[0] in self.meta.columns
+        ):
             # treat `_apply_filters(col=None)` as no filter applied
             if values is None:
                 continue
@@ -1627,7 +1632,22 @@ class IamDataFrame(object):
                     self.meta[col], values, regexp=regexp, has_nan=True
                 )
                 cat_idx = self.meta[matches].index
-                keep_col = _make_index(self._data, unique=False).isin(cat_idx)
+
+                # map the matching meta index to the data rows using level codes
+                levels, codes = zip(
+                    *[get_index_levels_codes(self._data, n) for n in cat_idx.names]
+                )
+                shape = [len(lvl) for lvl in levels]
+                match_codes = [
+                    lvl.get_indexer(cat_idx.get_level_values(n))
+                    for lvl, n in zip(levels, cat_idx.names)
+                ]
+                found = np.all([c >= 0 for c in match_codes], axis=0)
+                keep_col = keep.copy()
+                keep_col[keep] = np.isin(
+                    np.ravel_multi_index([c[keep] for c in codes], shape),
+                    np.ravel_multi_index([c[found] for c in match_codes], shape),
+                )
 
             elif col == "variable":
                 level = filters["level"] if "level" in filters else None
@@ -1637,17 +1657,14 @@ class IamDataFrame(object):
                 keep_col = get_keep_col(self._data, col_values[where], col)
 
             elif col == "year":
-                _data = (
-                    self.data[col]
-                    if self.time_col != "time"
-                    else self.data["time"].apply(lambda x: x.year)
-                )
-                keep_col = years_match(_data, values)
+                levels, codes = get_index_levels_codes(self._data, self.time_col)
+                if self.time_col == "time":
+                    levels = levels.year
+                keep_col = years_match(levels, values)[codes]
 
             elif col == "month" and self.time_col == "time":
-                keep_col = month_match(
-                    self.data["time"].apply(lambda x: x.month), values
-                )
+                levels, codes = get_index_levels_codes(self._data, "time")
+                keep_col = month_match(levels.month, values)[codes]
 
             elif col == "day" and self.time_col == "time":
                 if isinstance(values, str):
@@ -1657,18 +1674,21 @@ class IamDataFrame(object):
                 else:
                     wday = False
 
+                levels, codes = get_index_levels_codes(self._data, "time")
                 if wday:
-                    days = self.data["time"].apply(lambda x: x.weekday())
+                    days = levels.weekday
                 else:  # ints or list of ints
-                    days = self.data["time"].apply(lambda x: x.day)
+                    days = levels.day
 
-                keep_col = day_match(days, values)
+                keep_col = day_match(days, values)[codes]
 
             elif col == "hour" and self.time_col == "time":
-                keep_col = hour_match(self.data["time"].apply(lambda x: x.hour), values)
+                levels, codes = get_index_levels_codes(self._data, "time")
+                keep_col = hour_match(levels.hour, values)[codes]
 
             elif col == "time" and self.time_col == "time":
-                keep_col = datetime_match(self.data[col], values)
+                levels, codes = get_index_levels_codes(self._data, col)
+                keep_col = datetime_match(levels, values)[codes]
 
             elif col == "level":
                 if "variable" not in filters.keys():
@@ -1687,7 +1707,7 @@ class IamDataFrame(object):
             else:
                 _raise_filter_error(col)
 
-            keep = np.logical_and(keep, keep_col)
+            np.logical_and(keep, keep_col, out=keep)
 
         return keep
 
@@ -1830,14 +1850,15 @@ class IamDataFrame(object):
         Parameters
         ----------
         path : str, :class:`pathlib.Path` or :class:`pandas.ExcelFile`
-            A valid path or instance of an xlsx or csv file
+            A valid path or instance of an xlsx, csv or parquet file
         sheet_name : str, optional
             Name of the sheet to be parsed (if xlsx)
         ignore_conflict : bool, optional
             If `True`, values in `path` take precedence over existing `meta`.
             If `False`, raise an error in case of conflicts.
         kwargs
-            Passed to :func:`pandas.read_excel` or :func:`pandas.read_csv`
+            Passed to :func:`pandas.read_excel`, :func:`pandas.read_csv`
+            or :func:`pandas.read_parquet`
         """
         # load from file
         path = path if isinstance(path, pd.ExcelFile) else Path(path)
@@ -2024,72 +2045,97 @@ def _meta_idx(data):
     return data[META_IDX].drop_duplicates().set_index(META_IDX).index
 
 
+def _check_append_compatible(left, right):
+    """Raise an error if two IamDataFrames cannot be appended"""
+    if left.time_col != right.time_col:
+        raise ValueError("Incompatible time format (`year` vs. `time`)")
+
+    if left._data.index.names != right._data.index.names:
+        raise ValueError("Incompatible timeseries data index dimensions")
+
+
 def _raise_filter_error(col):
     """Raise an error if not possible to filter by col"""
     raise ValueError(f"Filter by `{col}` not supported!")
 
 
-def _check_rows(rows, check, in_range=True, return_test="any"):
-    """Check all rows to be in/out of a certain range and provide testing on
-    return values based on provided conditions
+def _apply_criteria(df, criteria, in_range=True, return_test="any"):
+    """Apply criteria individually to every model/scenario instance
+
+    All criteria are evaluated in one vectorized pass, where each row is
+    mapped to the criteria of its variable using the codes of the index.
 
     Parameters
     ----------
-    rows : pd.DataFrame
-        data rows
-    check : dict
-        dictionary with possible values of 'up', 'lo', and 'year'
+    df : pd.Series
+        timeseries data
+    criteria : dict
+        dictionary with variables mapped to a dictionary of checks
+        with possible values of 'up', 'lo', and 'year'
     in_range : bool, optional
         check if values are inside or outside of provided range
     return_test : str, optional
         possible values:
-            - 'any': default, return scenarios where check passes for any entry
-            - 'all': test if all values match checks, if not, return empty set
+            - 'any': default, return rows where check passes for any bound
+            - 'all': return rows of model/scenario instances (per variable)
+              where all values match all bounds
     """
     valid_checks = set(["up", "lo", "year"])
-    if not set(check.keys()).issubset(valid_checks):
-        msg = "Unknown checking type: {}"
-        raise ValueError(msg.format(check.keys() - valid_checks))
-    if "year" not in check:
-        where_idx = set(rows.index)
-    else:
-        if "time" in rows.index.names:
-            _years = rows.index.get_level_values("time").year
-        else:
-            _years = rows.index.get_level_values("year")
-        where_idx = set(rows.index[_years == check["year"]])
-        rows = rows.loc[list(where_idx)]
+    for check in criteria.values():
+        if not set(check.keys()).issubset(valid_checks):
+            msg = "Unknown checking type: {}"
+            raise ValueError(msg.format(check.keys() - valid_checks))
+    if return_test not in ["any", "all"]:
+        raise ValueError("Unknown return test: {}".format(return_test))
 
-    up_op = rows.values.__le__ if in_range else rows.values.__gt__
-    lo_op = rows.values.__ge__ if in_range else rows.values.__lt__
+    # map each row to the position of the criteria of its variable (or -1)
+    levels, codes = get_index_levels_codes(df, "variable")
+    lookup = np.full(len(levels), -1)
+    pos = levels.get_indexer(list(criteria))
+    lookup[pos[pos >= 0]] = np.arange(len(criteria))[pos >= 0]
+    pos = lookup[codes]
+    rows = pos >= 0
+    pos = pos[rows]
+
+    def _get_check(key):
+        """Return the checks of type `key` per row (nan if not given)"""
+        return np.array([c.get(key, np.nan) for c in criteria.values()])[pos]
+
+    # select rows in the relevant year (if given)
+    year = _get_check("year")
+    where = np.isnan(year)
+    if not where.all():
+        if "time" in df.index.names:
+            time_levels, time_codes = get_index_levels_codes(df, "time")
+            time_levels = time_levels.year
+        else:
+            time_levels, time_codes = get_index_levels_codes(df, "year")
+        where |= np.asarray(time_levels)[time_codes[rows]] == year
 
-    check_idx = []
-    for (bd, op) in [("up", up_op), ("lo", lo_op)]:
-        if bd in check:
-            check_idx.append(set(rows.index[op(check[bd])]))
+    # comparison with nan (bound not given) is always False
+    values, up, lo = df.values[rows], _get_check("up"), _get_check("lo")
+    with np.errstate(invalid="ignore"):
+        up_ok = values <= up if in_range else values > up
+        lo_ok = values >= lo if in_range else values < lo
 
     if return_test == "any":
-        ret = where_idx & set.union(*check_idx)
-    elif return_test == "all":
-        ret = where_idx if where_idx == set.intersection(*check_idx) else set()
+        keep = where & (up_ok | lo_ok)
     else:
-        raise ValueError("Unknown return test: {}".format(return_test))
-    return ret
-
+        # a model/scenario passes if none of the (relevant) rows fails a check,
+        # count failing rows per variable and model/scenario using index codes
+        fail = where & ~((np.isnan(up) | up_ok) & (np.isnan(lo) | lo_ok))
+        meta_codes = [get_index_levels_codes(df, i) for i in META_IDX]
+        dims = [len(criteria)] + [len(lvl) for lvl, _ in meta_codes]
+        joint = np.ravel_multi_index([pos] + [c[rows] for _, c in meta_codes], dims)
+        n_fail = np.bincount(joint[fail], minlength=np.prod(dims))
+        keep = where & (n_fail == 0)[joint]
 
-def _apply_criteria(df, criteria, **kwargs):
-    """Apply criteria individually to every model/scenario instance"""
-    idxs = []
-    for var, check in criteria.items():
-        _df = df[df.index.get_level_values("variable") == var]
-        for group in _df.groupby(META_IDX):
-            grp_idxs = _check_rows(group[-1], check, **kwargs)
-            idxs.append(grp_idxs)
-    df = df.loc[itertools.chain(*idxs)]
-    return df
+    _keep = np.zeros(len(df), dtype=bool)
+    _keep[rows] = keep
+    return df[_keep]
 
 
-def _make_index(df, cols=META_IDX, unique=True):
+def _make_index(df, cols=META_IDX):
     """Create an index from the columns/index of a dataframe or series"""
 
     def _get_col(c):
@@ -2098,10 +2144,8 @@ def _make_index(df, cols=META_IDX, unique=True):
         except KeyError:
             return df[c]
 
-    index = list(zip(*[_get_col(col) for col in cols]))
-    if unique:
-        index = pd.unique(index)
-    return pd.MultiIndex.from_tuples(index, names=tuple(cols))
+    index = pd.MultiIndex.from_arrays([_get_col(col) for col in cols], names=cols)
+    return index.unique()
 
 
 def _empty_iamframe(index):
@@ -2232,7 +2276,7 @@ def filter_by_meta(data, df, join_meta=False, **kwargs):
     meta = pd.DataFrame(df.meta[list(set(kwargs) - set(META_IDX))].copy())
 
     # filter meta by columns
-    keep = np.array([True] * len(meta))
+    keep = np.ones(len(meta), dtype=bool)
     apply_filter = False
     for col, values in kwargs.items():
         if col in META_IDX and values is not None:
@@ -2303,14 +2347,22 @@ def concat(dfs):
         msg = "Argument must be a non-string iterable (e.g., list or tuple)"
         raise TypeError(msg)
 
-    _df = None
-    for df in dfs:
-        df = df if isinstance(df, IamDataFrame) else IamDataFrame(df)
-        if _df is None:
-            _df = df.copy()
-        else:
-            _df.append(df, inplace=True)
-    return _df
+    dfs = [df if isinstance(df, IamDataFrame) else IamDataFrame(df) for df in dfs]
+    if not dfs:
+        return None
+
+    for df in dfs[1:]:
+        _check_append_compatible(dfs[0], df)
+
+    # concatenate the data of all objects at once (verify no duplicates)
+    _data = pd.concat([df._data for df in dfs], verify_integrity=True).sort_index()
+
+    # use the concatenated data instead of a (deep)copy of the first object
+    ret = copy.deepcopy(dfs[0], {id(dfs[0]._data): _data})
+    for df in dfs[1:]:
+        ret.meta = merge_meta(ret.meta, df.meta)
+    ret._set_attributes()
+    return ret
 
 
 def read_datapackage(path, data="data", meta="meta"):
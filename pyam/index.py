@@ -17,6 +17,13 @@ def get_index_levels(index, level):
     return list(index)
 
 
+def get_index_levels_codes(df, level):
+    """Return the category-values and the codes for a specific level"""
+    index = df if isinstance(df, pd.Index) else df.index
+    n = index._get_level_number(level)
+    return index.levels[n], index.codes[n]
+
+
 def replace_index_values(df, level, mapping):
     """Replace one or several category-values at a specific level"""
     index = df if isinstance(df, pd.Index) else df.index
@@ -11,6 +11,9 @@ import time
 import numpy as np
 import pandas as pd
 from collections.abc import Iterable
+from functools import lru_cache
+
+from pyam.index import get_index_levels_codes
 
 try:
     import seaborn as sns
@@ -137,6 +140,8 @@ def read_pandas(path, sheet_name="data*", *args, **kwargs):
     """Read a file and return a pandas.DataFrame"""
     if isinstance(path, Path) and path.suffix == ".csv":
         return pd.read_csv(path, *args, **kwargs)
+    elif isinstance(path, Path) and path.suffix == ".parquet":
+        return pd.read_parquet(path, *args, **kwargs)
     else:
         xl = pd.ExcelFile(path)
         sheet_names = pd.Series(xl.sheet_names)
@@ -307,16 +312,18 @@ def format_data(df, index, **kwargs):
             msg = "invalid column format, must be either years or `datetime`!"
             raise ValueError(msg)
         cols = index + REQUIRED_COLS + extra_cols
-        df = pd.melt(
-            df,
-            id_vars=cols,
-            var_name=time_col,
-            value_vars=sorted(melt_cols),
-            value_name="value",
-        )
-
-    # cast value column to numeric and drop nan
-    df["value"] = df["value"].astype("float64")
+        melt_cols = sorted(melt_cols)
+        # cast to long format by gathering only the non-nan values (instead
+        # of `pd.melt()` of the full cross-product and dropping nan later)
+        _values = df[melt_cols].values
+        _cols, _rows = np.nonzero(~pd.isnull(_values.T))
+        _data = {c: df[c].values[_rows] for c in cols}
+        _data[time_col] = np.array(melt_cols)[_cols]
+        _data["value"] = _values[_rows, _cols]
+        df = pd.DataFrame(_data)
+
+    # cast value column to numeric (without copy if already float) and drop nan
+    df["value"] = df["value"].astype("float64", copy=False)
     df.dropna(inplace=True, subset=["value"])
 
     # replace missing units by an empty string for user-friendly filtering
@@ -401,15 +408,9 @@ def merge_meta(left, right, ignore_conflict=False):
 
 def get_keep_col(data, values, col):
     """Return a list of booleans by filtering on values"""
-    keep_col = np.array([False] * len(data))
-    for v in values:
-        slc = data.index.get_loc_level(v, level=col)[0]
-        if isinstance(slc, slice):
-            for i in range(slc.start, slc.stop, slc.step if slc.step else 1):
-                keep_col[i] = True
-        else:
-            keep_col = np.logical_or(keep_col, slc)
-    return keep_col
+    # match on the (unique) levels of the index and map to rows by codes
+    levels, codes = get_index_levels_codes(data, col)
+    return levels.isin(values)[codes]
 
 
 def find_depth(data, s="", level=None):
@@ -462,41 +463,79 @@ def pattern_match(data, values, level=None, regexp=False, has_nan=False):
     and meta columns to pseudo-regex (if `regexp == False`)
     for filtering (str, int, bool)
     """
-    matches = np.array([False] * len(data))
     values = values if islistable(values) else [values]
 
+    # match categorical data on the categories and map to rows by codes
+    if isinstance(getattr(data, "dtype", None), pd.CategoricalDtype):
+        data = pd.Categorical(data)
+        # append nan as last category, to be used for rows with code `-1`
+        categories = pd.Series(list(data.categories) + [np.nan], dtype=object)
+        matches = pattern_match(categories, values, level, regexp, has_nan=True)
+        matches[-1] &= has_nan
+        return matches[data.codes]
+
+    matches = np.zeros(len(data), dtype=bool)
+
     # issue (#40) with string-to-nan comparison, replace nan by empty string
     _data = data.copy()
     if has_nan:
         _data.loc[[np.isnan(i) if not isstr(i) else False for i in _data]] = ""
 
+    strings = [s for s in values if isstr(s)]
     for s in values:
-        if isstr(s):
-            pattern = re.compile(_escape_regexp(s) + "$" if not regexp else s)
-            subset = filter(pattern.match, _data)
-            depth = True if level is None else find_depth(_data, s, level)
-            matches = np.logical_or(matches, _data.isin(subset) & depth)
-        else:
-            matches = np.logical_or(matches, data == s)
+        if not isstr(s):
+            matches |= np.asarray(data == s)
+
+    # strings without wildcards are matched exactly using a hash-lookup
+    if not regexp and level is None:
+        exact = [s for s in strings if "*" not in s]
+        if exact:
+            matches |= np.asarray(_data.isin(exact))
+        strings = [s for s in strings if "*" in s]
+
+    if not strings:
+        return matches
+
+    # match all remaining pseudo-regexps in one pass using a combined regexp
+    if not regexp and level is None:
+        return matches | _match_regexp(_data, _compile_pseudo_regexp(tuple(strings)))
+
+    # match (user-provided) regexps or pseudo-regexps with `level` individually
+    for s in strings:
+        pattern = _compile_regexp(s) if regexp else _compile_pseudo_regexp((s,))
+        depth = True if level is None else find_depth(_data, s, level)
+        matches |= _match_regexp(_data, pattern) & depth
     return matches
 
 
+@lru_cache(maxsize=1024)
+def _compile_regexp(s):
+    """Return a compiled (user-provided) regexp"""
+    return re.compile(s)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pseudo_regexp(strings):
+    """Return a compiled regexp matching any of a tuple of pseudo-regexps"""
+    return re.compile("|".join(f"(?:{_escape_regexp(s)}$)" for s in strings))
+
+
+def _match_regexp(data, pattern):
+    """Return a boolean array where data matches the compiled regexp"""
+    return np.asarray(pd.Series(data, dtype=object).str.match(pattern, na=False))
+
+
 def _escape_regexp(s):
-    """Escape characters with specific regexp use"""
-    return (
-        str(s)
-        .replace("|", "\\|")
-        .replace(".", "\.")  # `.` has to be replaced before `*`
-        .replace("*", ".*")
-        .replace("+", "\+")
-        .replace("(", "\(")
-        .replace(")", "\)")
-        .replace("$", "\\$")
-    )
+    """Escape characters with specific regexp use, use `*` as wildcard"""
+    return re.escape(str(s)).replace("\\*", ".*")
 
 
 def years_match(data, years):
     """Return rows where data matches year"""
+    # a contiguous range can be matched by comparison (no hashing required)
+    if isinstance(years, range) and years.step == 1:
+        return np.logical_and(data >= years.start, data < years.stop)
+
     years = [years] if (isinstance(years, (int, np.int64))) else years
     dt = (datetime.datetime, np.datetime64)
     if isinstance(years, dt) or isinstance(years[0], dt):
@@ -625,7 +664,7 @@ def to_int(x, index=False):
     else, the function casts the index of x to int and returns x with new index
     """
     _x = x.index if index else x
-    cols = list(map(int, _x))
+    cols = _x.astype("int64")
     error = _x[cols != _x]
     if not error.empty:
         raise ValueError("invalid values `{}`".format(list(error)))
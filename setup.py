@@ -28,7 +28,12 @@ REQUIREMENTS = [
 
 EXTRA_REQUIREMENTS = {
     "tests": ["coverage", "coveralls", "pytest<6.0.0", "pytest-cov", "pytest-mpl<0.12"],
-    "optional-io-formats": ["datapackage", "pandas-datareader", "unfccc_di_api>=2.0"],
+    "optional-io-formats": [
+        "datapackage",
+        "pandas-datareader",
+        "pyarrow",
+        "unfccc_di_api>=2.0",
+    ],
     "deploy": ["twine", "setuptools", "wheel"],
     "tutorials": ["pypandoc", "nbformat", "nbconvert", "jupyter_client", "ipykernel"],
     "docs": [
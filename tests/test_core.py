@@ -1016,6 +1016,10 @@ def test_concat(test_df):
     pd.testing.assert_frame_equal(obs, exp)
 
 
+def test_concat_with_duplicates_raises(test_df):
+    pytest.raises(ValueError, concat, [test_df, test_df])
+
+
 def test_normalize(test_df):
     exp = test_df.data.copy().reset_index(drop=True)
     exp.loc[1::2, "value"] /= exp["value"][::2].values
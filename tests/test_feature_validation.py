@@ -108,6 +108,13 @@ def test_validate_both(test_df):
     assert list(test_df["exclude"]) == [True, True]
 
 
+def test_validate_multiple_variables(test_df):
+    criteria = {"Primary Energy": {"up": 6.5}, "Primary Energy|Coal": {"up": 2}}
+    obs = test_df.validate(criteria, exclude_on_fail=True)
+    pdt.assert_frame_equal(obs, test_df.data[3:6:2].reset_index(drop=True))
+    assert list(test_df["exclude"]) == [True, True]
+
+
 def test_validate_year(test_df):
     # checking that the year filter works as expected
     obs = test_df.validate({"Primary Energy": {"up": 6, "year": 2005}})
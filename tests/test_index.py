@@ -1,7 +1,7 @@
 import pytest
 import pandas.testing as pdt
 
-from pyam.index import get_index_levels, replace_index_values
+from pyam.index import get_index_levels, get_index_levels_codes, replace_index_values
 from pyam import IAMC_IDX
 
 
@@ -16,6 +16,13 @@ def test_get_index_levels_raises(test_df_index):
         get_index_levels(test_df_index, "foo")
 
 
+def test_get_index_levels_codes(test_df_index):
+    """Assert that get_index_levels_codes returns the correct values"""
+    levels, codes = get_index_levels_codes(test_df_index, "scenario")
+    assert list(levels) == ["scen_a", "scen_b"]
+    assert list(codes) == [0, 0, 1]
+
+
 @pytest.mark.parametrize(
     "exp_scen, mapping",
     [
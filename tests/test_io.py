@@ -50,6 +50,20 @@ def test_io_csv(test_df, tmpdir):
     pd.testing.assert_frame_equal(test_df.data, import_df.data)
 
 
+def test_io_parquet(test_df, tmpdir):
+    # write to parquet (with column headers as str)
+    file = tmpdir / "testing_io_write_read.parquet"
+    test_df._to_file_format(iamc_index=False).to_parquet(file)
+
+    # read from parquet and assert that `data` tables are equal
+    import_df = IamDataFrame(file)
+    pd.testing.assert_frame_equal(test_df.data, import_df.data)
+
+    # read with filters applied by the parquet engine
+    import_df = IamDataFrame(file, filters=[("Scenario", "in", ["scen_a"])])
+    pd.testing.assert_frame_equal(test_df.filter(**FILTER_ARGS).data, import_df.data)
+
+
 @pytest.mark.parametrize(
     "meta_args", [[{}, {}], [dict(include_meta="foo"), dict(meta_sheet_name="foo")]]
 )
@@ -158,6 +172,22 @@ def test_load_meta_csv(test_pd_df, rename, tmpdir):
     assert_iamframe_equal(obs, exp)
 
 
+def test_load_meta_parquet(test_pd_df, tmpdir):
+    """Test loading meta from a parquet file"""
+    # initialize a new IamDataFrame directly from data and meta
+    exp = IamDataFrame(test_pd_df, meta=META_DF)
+
+    # write meta to file (without an exclude col)
+    file = tmpdir / "testing_io_meta.parquet"
+    META_DF.reset_index().to_parquet(file)
+
+    # initialize a new IamDataFrame and load meta from file
+    obs = IamDataFrame(test_pd_df)
+    obs.load_meta(file)
+
+    assert_iamframe_equal(obs, exp)
+
+
 def test_load_meta_wrong_index(test_df_year, tmpdir):
     """Loading meta without (at least) index cols as headers raises an error"""
 
@@ -89,6 +89,32 @@ def test_pattern_match_dollar():
     assert (obs == [True, False]).all()
 
 
+def test_pattern_match_multiple():
+    data = pd.Series(["foo", "foo|bar", "baz", "bar|baz"])
+    values = ["baz", "foo|*", "*|baz"]
+
+    obs = utils.pattern_match(data, values)
+    assert (obs == [False, True, True, True]).all()
+
+
+@pytest.mark.parametrize("has_nan", [True, False])
+def test_pattern_match_categorical(has_nan):
+    data = pd.Series(["foo", "bar", np.nan, "foo"], dtype="category")
+    values = ["foo", ""]
+
+    obs = utils.pattern_match(data, values, has_nan=has_nan)
+    assert (obs == [True, False, has_nan, True]).all()
+
+
+@pytest.mark.parametrize("level", [None, 0])
+def test_pattern_match_metacharacters(level):
+    data = pd.Series(["Price [USD]", "Price U", "Price^2 {a?}", "Price\\USD"])
+
+    for i, value in enumerate(data):
+        obs = utils.pattern_match(data, value, level=level)
+        assert (obs == [j == i for j in range(len(data))]).all()
+
+
 def test_pattern_regexp():
     data = pd.Series(["foo", "foa", "foo$"])
     values = ["fo.$"]
@@ -97,6 +123,30 @@ def test_pattern_regexp():
     assert (obs == [True, True, False]).all()
 
 
+@pytest.mark.parametrize(
+    "years, exp",
+    [
+        (2010, [False, True, False, False]),
+        ([2005, 2020], [True, False, False, True]),
+        (range(2010, 2020), [False, True, True, False]),
+        (range(2005, 2025, 10), [True, False, True, False]),
+    ],
+)
+def test_years_match(years, exp):
+    data = pd.Series([2005, 2010, 2015, 2020])
+
+    obs = utils.years_match(data, years)
+    assert (obs == exp).all()
+
+
+def test_pattern_regexp_inline_flag():
+    data = pd.Series(["Primary Energy", "Secondary Energy"])
+    values = ["(?i)primary energy", "(?i)secondary"]
+
+    obs = utils.pattern_match(data, values, regexp=True)
+    assert (obs == [True, True]).all()
+
+
 def test_find_depth():
     obs = utils.find_depth(TEST_VARS)
     assert obs == [0, 1, 2]